@@ -1,14 +0,0 @@
-"""
-Device module for Smart Home system.
-"""
-from .base import Device, Sensor, Actuator
-from .sensors import TemperatureSensor, LightSensor, MotionSensor
-from .actuators import LightActuator, HeaterActuator, AlarmActuator
-
-__all__ = [
-    'Device', 'Sensor', 'Actuator',
-    'TemperatureSensor', 'LightSensor', 'MotionSensor',
-    'LightActuator', 'HeaterActuator', 'AlarmActuator'
-]
-
-
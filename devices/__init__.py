@@ -1,13 +1,15 @@
 """
 Device module for Smart Home system.
 """
-from .base import Device, Sensor, Actuator
+from .base import Device, Sensor, Actuator, SensorEvent
+from .queues import MPSCQueue
 from .sensors import TemperatureSensor, LightSensor, MotionSensor
 from .actuators import LightActuator, HeaterActuator, AlarmActuator
 
 __all__ = [
-    'Device', 'Sensor', 'Actuator',
+    'Device', 'Sensor', 'Actuator', 'SensorEvent',
     'TemperatureSensor', 'LightSensor', 'MotionSensor',
-    'LightActuator', 'HeaterActuator', 'AlarmActuator'
+    'LightActuator', 'HeaterActuator', 'AlarmActuator',
+    'MPSCQueue'
 ]
 
@@ -4,6 +4,8 @@ from .base import Actuator
 
 class LightActuator(Actuator):
     
+    __slots__ = ()
+    
     def __init__(self, device_id: str, name: str, enabled: bool = True,
                  initial_state: bool = False, command_queue=None):
         super().__init__(device_id, name, enabled, command_queue)
@@ -11,7 +13,8 @@ class LightActuator(Actuator):
         
     def _on_state_change(self, old_state: bool, new_state: bool):
         status = "ON" if new_state else "OFF"
-        self.logger.info(f"{self.name} turned {status}")
+        if self._log_isinfo:
+            self._log_info("%s turned %s", self.name, status)
         
     def _execute_command(self, command: Dict[str, Any]):
         if 'action' in command:
@@ -20,8 +23,7 @@ class LightActuator(Actuator):
             elif command['action'] == 'turn_off':
                 self.set_state(False)
             elif command['action'] == 'toggle':
-                current = self.get_state()
-                self.set_state(not current)
+                self.toggle_state()
         elif 'state' in command:
             self.set_state(bool(command['state']))
             
@@ -31,6 +33,8 @@ class LightActuator(Actuator):
 
 class HeaterActuator(Actuator):
     
+    __slots__ = ('target_temperature',)
+    
     def __init__(self, device_id: str, name: str, enabled: bool = True,
                  initial_state: bool = False, target_temperature: float = 20.0,
                  command_queue=None):
@@ -40,7 +44,8 @@ class HeaterActuator(Actuator):
         
     def _on_state_change(self, old_state: bool, new_state: bool):
         status = "ON" if new_state else "OFF"
-        self.logger.info(f"{self.name} turned {status} (target: {self.target_temperature}°C)")
+        if self._log_isinfo:
+            self._log_info("%s turned %s (target: %s°C)", self.name, status, self.target_temperature)
         
     def _execute_command(self, command: Dict[str, Any]):
         if 'action' in command:
@@ -49,8 +54,7 @@ class HeaterActuator(Actuator):
             elif command['action'] == 'turn_off':
                 self.set_state(False)
             elif command['action'] == 'toggle':
-                current = self.get_state()
-                self.set_state(not current)
+                self.toggle_state()
         elif 'state' in command:
             self.set_state(bool(command['state']))
             
@@ -63,6 +67,8 @@ class HeaterActuator(Actuator):
 
 class AlarmActuator(Actuator):
     
+    __slots__ = ()
+    
     def __init__(self, device_id: str, name: str, enabled: bool = True,
                  initial_state: bool = False, command_queue=None):
         super().__init__(device_id, name, enabled, command_queue)
@@ -70,9 +76,10 @@ class AlarmActuator(Actuator):
         
     def _on_state_change(self, old_state: bool, new_state: bool):
         if new_state:
-            self.logger.warning(f"{self.name} ACTIVATED!")
+            self._log_warn("%s ACTIVATED!", self.name)
         else:
-            self.logger.info(f"{self.name} deactivated")
+            if self._log_isinfo:
+                self._log_info("%s deactivated", self.name)
             
     def _execute_command(self, command: Dict[str, Any]):
         if 'action' in command:
@@ -81,8 +88,7 @@ class AlarmActuator(Actuator):
             elif command['action'] == 'deactivate':
                 self.set_state(False)
             elif command['action'] == 'toggle':
-                current = self.get_state()
-                self.set_state(not current)
+                self.toggle_state()
         elif 'state' in command:
             self.set_state(bool(command['state']))
             
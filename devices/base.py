@@ -2,90 +2,144 @@ import threading
 import time
 import logging
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
-from queue import Queue
+from typing import Any, Dict, List, NamedTuple, Optional
+from queue import Queue, Empty
+
+from .queues import MPSCQueue
+
+
+class SensorEvent(NamedTuple):
+    sensor_id: str
+    sensor_name: str
+    value: Any
+    timestamp: int
 
 
 class Device(ABC):
     
+    __slots__ = ('device_id', 'name', 'enabled', '_stop_event', '_lock', '_log_isinfo')
+    
+    logger = logging.getLogger(f"{__name__}.Device")
+    _log_info = logger.info
+    _log_warn = logger.warning
+    _log_err = logger.error
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.logger = logging.getLogger(f"{__name__}.{cls.__name__}")
+        cls._log_info = cls.logger.info
+        cls._log_warn = cls.logger.warning
+        cls._log_err = cls.logger.error
+    
     def __init__(self, device_id: str, name: str, enabled: bool = True):
         self.device_id = device_id
         self.name = name
         self.enabled = enabled
-        self._running = False
-        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._stop_event.set()
         self._lock = threading.Lock()
-        self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+        self._log_isinfo = self.logger.isEnabledFor(logging.INFO)
         
     def start(self):
         if not self.enabled:
             self.logger.warning(f"{self.name} is disabled, not starting")
             return
             
-        if self._running:
+        if not self._stop_event.is_set():
             self.logger.warning(f"{self.name} is already running")
             return
             
-        self._running = True
-        self._thread = threading.Thread(target=self._run, daemon=True)
-        self._thread.start()
+        self._stop_event.clear()
+        self._on_start()
         self.logger.info(f"{self.name} started")
         
     def stop(self):
-        with self._lock:
-            self._running = False
-        if self._thread:
-            self._thread.join(timeout=5.0)
+        self._stop_event.set()
+        self._on_stop()
         self.logger.info(f"{self.name} stopped")
         
     def is_running(self) -> bool:
-        with self._lock:
-            return self._running
+        return not self._stop_event.is_set()
             
-    @abstractmethod
-    def _run(self):
+    def _on_start(self):
+        pass
+        
+    def _on_stop(self):
         pass
 
 
 class Sensor(Device):
     
+    __slots__ = (
+        'update_interval', 'data_queue', 'threaded', '_thread', '_current_value',
+        '_batch', '_batch_size', '_flush_interval', '_last_flush'
+    )
+    
     def __init__(self, device_id: str, name: str, update_interval: float, 
-                 enabled: bool = True, data_queue: Optional[Queue] = None):
+                 enabled: bool = True, data_queue: Optional[MPSCQueue] = None,
+                 threaded: bool = True):
         super().__init__(device_id, name, enabled)
         self.update_interval = update_interval
-        self.data_queue = data_queue or Queue()
+        self.threaded = threaded
+        # Only self-driven sensors publish through a queue.
+        self.data_queue = data_queue or (MPSCQueue() if threaded else None)
+        self._thread: Optional[threading.Thread] = None
         self._current_value: Any = None
+        self._batch: List[SensorEvent] = []
+        self._batch_size = 10
+        self._flush_interval = 1.0
+        self._last_flush = time.monotonic()
         
     def get_current_value(self) -> Any:
-        with self._lock:
-            return self._current_value
+        return self._current_value
+        
+    def sample(self) -> SensorEvent:
+        value = self._read_sensor()
+        self._current_value = value
+        return SensorEvent(self.device_id, self.name, value, time.monotonic_ns())
             
-    def _send_data(self, data: Dict[str, Any]):
+    def _send_data(self, event: SensorEvent):
         if self.data_queue:
-            data['sensor_id'] = self.device_id
-            data['sensor_name'] = self.name
-            data['timestamp'] = time.time()
-            self.data_queue.put(data)
+            self._batch.append(event)
+            if (len(self._batch) >= self._batch_size or
+                    time.monotonic() - self._last_flush >= self._flush_interval):
+                self._flush_data()
+                
+    def _flush_data(self):
+        if self._batch:
+            self.data_queue.put(self._batch)
+            self._batch = []
+        self._last_flush = time.monotonic()
+            
+    def _on_start(self):
+        # Unthreaded sensors are sampled by their owner (the hub controller).
+        if self.threaded:
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+        
+    def _on_stop(self):
+        if self._thread:
+            self._thread.join(timeout=5.0)
+            self._thread = None
             
     @abstractmethod
     def _read_sensor(self) -> Any:
         pass
         
     def _run(self):
-        while self.is_running():
+        while not self._stop_event.is_set():
             try:
-                value = self._read_sensor()
-                with self._lock:
-                    self._current_value = value
-                self._send_data({'value': value})
-                time.sleep(self.update_interval)
+                self._send_data(self.sample())
             except Exception as e:
-                self.logger.error(f"Error in {self.name}: {e}", exc_info=True)
-                time.sleep(self.update_interval)
+                self._log_err("Error in %s: %s", self.name, e, exc_info=True)
+            self._stop_event.wait(self.update_interval)
+        self._flush_data()
 
 
 class Actuator(Device):
     
+    __slots__ = ('command_queue', '_state')
+    
     def __init__(self, device_id: str, name: str, enabled: bool = True, 
                  command_queue: Optional[Queue] = None):
         super().__init__(device_id, name, enabled)
@@ -93,16 +147,27 @@ class Actuator(Device):
         self._state: Any = None
         
     def get_state(self) -> Any:
-        with self._lock:
-            return self._state
+        return self._state
             
     def set_state(self, new_state: Any):
         with self._lock:
             old_state = self._state
             self._state = new_state
-            if old_state != new_state:
-                self.logger.info(f"{self.name} state changed: {old_state} -> {new_state}")
-                self._on_state_change(old_state, new_state)
+            changed = old_state != new_state
+        if changed:
+            if self._log_isinfo:
+                self._log_info("%s state changed: %s -> %s", self.name, old_state, new_state)
+            self._on_state_change(old_state, new_state)
+            
+    def toggle_state(self) -> bool:
+        with self._lock:
+            old_state = self._state
+            new_state = not old_state
+            self._state = new_state
+        if self._log_isinfo:
+            self._log_info("%s state changed: %s -> %s", self.name, old_state, new_state)
+        self._on_state_change(old_state, new_state)
+        return new_state
                 
     @abstractmethod
     def _on_state_change(self, old_state: Any, new_state: Any):
@@ -112,16 +177,20 @@ class Actuator(Device):
     def _execute_command(self, command: Dict[str, Any]):
         pass
         
-    def _run(self):
-        while self.is_running():
+    def execute(self, command: Dict[str, Any]):
+        try:
+            self._execute_command(command)
+        except Exception as e:
+            self._log_err("Error in %s: %s", self.name, e, exc_info=True)
+            
+    def execute_batch(self, commands: List[Dict[str, Any]]):
+        for command in commands:
+            self.execute(command)
+            
+    def process_commands(self):
+        while True:
             try:
-                if not self.command_queue.empty():
-                    command = self.command_queue.get(timeout=0.1)
-                    self._execute_command(command)
-                else:
-                    time.sleep(0.1)
-            except Exception as e:
-                if self.is_running():
-                    self.logger.error(f"Error in {self.name}: {e}", exc_info=True)
-                time.sleep(0.1)
-
+                command = self.command_queue.get_nowait()
+            except Empty:
+                return
+            self.execute(command)
@@ -0,0 +1,37 @@
+import threading
+from collections import deque
+from queue import Empty
+from typing import Any, Optional
+
+
+class MPSCQueue:
+
+    def __init__(self, not_empty: Optional[threading.Event] = None):
+        self._items = deque()
+        # A caller-supplied event may be shared with other queues and a
+        # consumer loop (the hub passes its controller wake event); a blocking
+        # get() would clear it and swallow that consumer's wakeups.
+        self._shared_event = not_empty is not None
+        self._not_empty = not_empty or threading.Event()
+
+    def put(self, item: Any):
+        self._items.append(item)
+        self._not_empty.set()
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> Any:
+        if block and self._shared_event:
+            raise RuntimeError("blocking get() is not supported on a queue with a shared event; "
+                               "use get_nowait()")
+        while True:
+            try:
+                return self._items.popleft()
+            except IndexError:
+                if not block or not self._not_empty.wait(timeout):
+                    raise Empty
+                self._not_empty.clear()
+
+    def get_nowait(self) -> Any:
+        return self.get(block=False)
+
+    def empty(self) -> bool:
+        return not self._items
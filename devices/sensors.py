@@ -1,26 +1,41 @@
 import random
 import time
-from typing import Dict, Any
+from typing import Callable, Dict, Any
 from .base import Sensor
 
 
+def _make_walker(lo: float, hi: float, spread: float,
+                 rng: Callable[[], float]) -> Callable[[float], float]:
+    # Bounds and RNG are bound as closure locals so each step is one
+    # rng() call and no attribute lookups.
+    def step(x: float) -> float:
+        x += (rng() * 2.0 - 1.0) * spread
+        return lo if x < lo else hi if x > hi else x
+    return step
+
+
 class TemperatureSensor(Sensor):
     
+    __slots__ = (
+        'current_temp', 'min_value', 'max_value', 'variation_range', '_step'
+    )
+    
     def __init__(self, device_id: str, name: str, update_interval: float,
                  initial_value: float = 20.0, min_value: float = 15.0,
                  max_value: float = 25.0, variation_range: float = 2.0,
-                 enabled: bool = True, data_queue=None):
-        super().__init__(device_id, name, update_interval, enabled, data_queue)
+                 enabled: bool = True, data_queue=None, threaded: bool = True):
+        super().__init__(device_id, name, update_interval, enabled, data_queue,
+                         threaded)
         self.current_temp = initial_value
         self.min_value = min_value
         self.max_value = max_value
         self.variation_range = variation_range
         self._current_value = initial_value
+        self._step = _make_walker(min_value, max_value, variation_range,
+                                  random.Random().random)
         
     def _read_sensor(self) -> float:
-        change = random.uniform(-self.variation_range, self.variation_range)
-        self.current_temp = max(self.min_value, 
-                               min(self.max_value, self.current_temp + change))
+        self.current_temp = self._step(self.current_temp)
         return round(self.current_temp, 2)
         
     def simulate_heating_effect(self, heater_on: bool):
@@ -34,21 +49,26 @@ class TemperatureSensor(Sensor):
 
 class LightSensor(Sensor):
     
+    __slots__ = (
+        'current_level', 'min_value', 'max_value', 'variation_range', '_step'
+    )
+    
     def __init__(self, device_id: str, name: str, update_interval: float,
                  initial_value: float = 50.0, min_value: float = 0.0,
                  max_value: float = 100.0, variation_range: float = 10.0,
-                 enabled: bool = True, data_queue=None):
-        super().__init__(device_id, name, update_interval, enabled, data_queue)
+                 enabled: bool = True, data_queue=None, threaded: bool = True):
+        super().__init__(device_id, name, update_interval, enabled, data_queue,
+                         threaded)
         self.current_level = initial_value
         self.min_value = min_value
         self.max_value = max_value
         self.variation_range = variation_range
         self._current_value = initial_value
+        self._step = _make_walker(min_value, max_value, variation_range,
+                                  random.Random().random)
         
     def _read_sensor(self) -> float:
-        change = random.uniform(-self.variation_range, self.variation_range)
-        self.current_level = max(self.min_value,
-                                min(self.max_value, self.current_level + change))
+        self.current_level = self._step(self.current_level)
         return round(self.current_level, 2)
         
     def simulate_light_effect(self, light_on: bool):
@@ -62,13 +82,17 @@ class LightSensor(Sensor):
 
 class MotionSensor(Sensor):
     
+    __slots__ = ('motion_probability', '_motion_detected')
+    
     def __init__(self, device_id: str, name: str, update_interval: float,
                  motion_probability: float = 0.3, enabled: bool = True,
-                 data_queue=None):
-        super().__init__(device_id, name, update_interval, enabled, data_queue)
+                 data_queue=None, threaded: bool = True):
+        super().__init__(device_id, name, update_interval, enabled, data_queue,
+                         threaded)
         self.motion_probability = motion_probability
         self._current_value = False
         self._motion_detected = False
+        self._batch_size = 1
         
     def _read_sensor(self) -> bool:
         self._motion_detected = random.random() < self.motion_probability
@@ -1,19 +1,65 @@
+import bisect
 import logging
-from typing import Dict, Any, List, Optional
+import re
+from typing import Dict, Any, List, Optional, Sequence, Set, Tuple
 from datetime import datetime
 
+_OPERATORS = ('<', '>', '<=', '>=', '==', '!=')
+_MISSING = object()
+
+
+def _compile_condition(rule_id: str, spec: Sequence[Any]):
+    # Missing inputs read as False for ==/!= terms and None (never fires)
+    # for ordered comparisons, matching state.get(...).get(field, default).
+    inputs: Dict[Tuple[str, str], str] = {}
+    defaults: Dict[str, Any] = {}
+    terms = []
+    for term in spec:
+        if isinstance(term, bool):
+            if not term:
+                terms = ['False']
+                inputs = {}
+                break
+            continue
+        key, field, op, operand = term
+        if op not in _OPERATORS:
+            raise ValueError(f"Unsupported operator {op!r} in rule {rule_id}")
+        var = inputs.setdefault((key, field), f"v{len(inputs)}")
+        defaults.setdefault(var, False if op in ('==', '!=') else None)
+        if isinstance(operand, bool) and op in ('==', '!='):
+            terms.append(var if operand == (op == '==') else f"not {var}")
+        elif op in ('==', '!='):
+            terms.append(f"{var} {op} {operand!r}")
+        else:
+            terms.append(f"({var} is not None and {var} {op} {operand!r})")
+            
+    func_name = 'cond_' + re.sub(r'\W', '_', rule_id)
+    lines = [f"def {func_name}(s):"]
+    for (key, field), var in inputs.items():
+        lines.append(f"    {var} = (s.get({key!r}) or {{}}).get({field!r}, {defaults[var]!r})")
+    lines.append(f"    return {' and '.join(terms) or 'True'}")
+    
+    namespace: Dict[str, Any] = {}
+    exec(compile('\n'.join(lines), f"<rule {rule_id}>", 'exec'), namespace)
+    # Input-less specs return None so the engine evaluates them every pass.
+    return namespace[func_name], tuple(inputs) or None
+
 
 class Rule:
     
     def __init__(self, rule_id: str, name: str, condition_func, action_func, 
-                 priority: int = 0):
+                 priority: int = 0, inputs: Optional[Tuple[Tuple[str, str], ...]] = None):
         self.rule_id = rule_id
         self.name = name
         self.condition_func = condition_func
         self.action_func = action_func
         self.priority = priority
+        self.inputs = inputs
         self.last_triggered: Optional[datetime] = None
         
+    def __lt__(self, other: 'Rule') -> bool:
+        return self.priority < other.priority
+        
     def evaluate(self, state: Dict[str, Any]) -> bool:
         try:
             return self.condition_func(state)
@@ -36,87 +82,111 @@ class RuleEngine:
         self.config = config
         self.rules: List[Rule] = []
         self.logger = logging.getLogger(__name__)
+        self._rules_by_key: Dict[str, List[Rule]] = {}
+        self._watched: Dict[str, Set[str]] = {}
+        self._last_inputs: Dict[Tuple[str, str], Any] = {}
         self._initialize_rules()
         
     def _initialize_rules(self):
         rules_config = self.config.get('rules', {})
-        def temp_low_condition(state):
-            temp = state.get('temperature', {}).get('value')
-            heater = state.get('heater', {}).get('state', False)
-            return temp is not None and temp < rules_config.get('temperature_threshold_low', 18.0) and not heater
-            
+        temp_low = rules_config.get('temperature_threshold_low', 18.0)
+        temp_high = rules_config.get('temperature_threshold_high', 22.0)
+        light_low = rules_config.get('light_threshold_low', 30.0)
+        home_occupied = rules_config.get('home_occupied', True)
+        
         def temp_low_action(state):
             return [{'actuator': 'heater', 'action': 'turn_on'}]
             
         self.add_rule('temp_low', 'Temperature Low - Turn On Heater',
-                     temp_low_condition, temp_low_action, priority=1)
+                     [('temperature', 'value', '<', temp_low),
+                      ('heater', 'state', '==', False)],
+                     temp_low_action, priority=1)
         
-        def temp_high_condition(state):
-            temp = state.get('temperature', {}).get('value')
-            heater = state.get('heater', {}).get('state', False)
-            return temp is not None and temp > rules_config.get('temperature_threshold_high', 22.0) and heater
-            
         def temp_high_action(state):
             return [{'actuator': 'heater', 'action': 'turn_off'}]
             
         self.add_rule('temp_high', 'Temperature High - Turn Off Heater',
-                     temp_high_condition, temp_high_action, priority=1)
-        
-        def motion_light_condition(state):
-            motion = state.get('motion', {}).get('value', False)
-            light_level = state.get('light', {}).get('value')
-            lights = state.get('light_actuator', {}).get('state', False)
-            return (motion and 
-                   light_level is not None and 
-                   light_level < rules_config.get('light_threshold_low', 30.0) and
-                   not lights)
+                     [('temperature', 'value', '>', temp_high),
+                      ('heater', 'state', '==', True)],
+                     temp_high_action, priority=1)
         
         def motion_light_action(state):
             return [{'actuator': 'light', 'action': 'turn_on'}]
             
         self.add_rule('motion_light', 'Motion + Low Light - Turn On Lights',
-                     motion_light_condition, motion_light_action, priority=2)
-        
-        def no_motion_light_condition(state):
-            motion = state.get('motion', {}).get('value', False)
-            lights = state.get('light_actuator', {}).get('state', False)
-            return not motion and lights
+                     [('motion', 'value', '==', True),
+                      ('light', 'value', '<', light_low),
+                      ('light_actuator', 'state', '==', False)],
+                     motion_light_action, priority=2)
         
         def no_motion_light_action(state):
             return [{'actuator': 'light', 'action': 'turn_off'}]
             
         self.add_rule('no_motion_light', 'No Motion - Turn Off Lights',
-                     no_motion_light_condition, no_motion_light_action, priority=3)
-        
-        def security_alarm_condition(state):
-            motion = state.get('motion', {}).get('value', False)
-            home_occupied = rules_config.get('home_occupied', True)
-            alarm = state.get('alarm', {}).get('state', False)
-            return motion and not home_occupied and not alarm
+                     [('motion', 'value', '==', False),
+                      ('light_actuator', 'state', '==', True)],
+                     no_motion_light_action, priority=3)
         
         def security_alarm_action(state):
             return [{'actuator': 'alarm', 'action': 'activate'}]
             
         self.add_rule('security_alarm', 'Security Alert - Motion When Home Empty',
-                     security_alarm_condition, security_alarm_action, priority=0)
+                     [not home_occupied,
+                      ('motion', 'value', '==', True),
+                      ('alarm', 'state', '==', False)],
+                     security_alarm_action, priority=0)
         
-    def add_rule(self, rule_id: str, name: str, condition_func, action_func,
+    def add_rule(self, rule_id: str, name: str, condition, action_func,
                  priority: int = 0):
-        """Add a new rule to the engine."""
-        rule = Rule(rule_id, name, condition_func, action_func, priority)
-        self.rules.append(rule)
-        # Sort by priority (lower number = higher priority)
-        self.rules.sort(key=lambda r: r.priority)
+        """Add a new rule to the engine.
+        
+        ``condition`` is either a callable taking the state dict or a list of
+        ``(state_key, field, operator, operand)`` terms that are compiled into
+        a single predicate.
+        """
+        if callable(condition):
+            rule = Rule(rule_id, name, condition, action_func, priority)
+        else:
+            condition_func, inputs = _compile_condition(rule_id, condition)
+            rule = Rule(rule_id, name, condition_func, action_func, priority, inputs)
+            for key, field in inputs or ():
+                self._rules_by_key.setdefault(key, []).append(rule)
+                self._watched.setdefault(key, set()).add(field)
+        # Keep sorted by priority (lower number = higher priority)
+        bisect.insort(self.rules, rule)
+        
+    def clear_rules(self):
+        """Remove every rule, including the built-in ones, and their indexes."""
+        self.rules = []
+        self._rules_by_key = {}
+        self._watched = {}
+        self._last_inputs = {}
         
-    def evaluate_rules(self, state: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Evaluate all rules and return list of commands."""
-        commands = []
+    def _changed_keys(self, state: Dict[str, Any]) -> Set[str]:
+        changed = set()
+        for key, fields in self._watched.items():
+            entry = state.get(key) or {}
+            for field in fields:
+                value = entry.get(field)
+                if self._last_inputs.get((key, field), _MISSING) != value:
+                    self._last_inputs[(key, field)] = value
+                    changed.add(key)
+        return changed
+        
+    def evaluate_rules(self, state: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
+        """Evaluate rules whose inputs changed and return commands grouped by actuator."""
+        commands: Dict[str, List[Dict[str, Any]]] = {}
         triggered_rules = []
         
+        changed = self._changed_keys(state)
+        candidates = {id(rule) for key in changed for rule in self._rules_by_key[key]}
+        
         for rule in self.rules:
+            if rule.inputs is not None and id(rule) not in candidates:
+                continue
             if rule.evaluate(state):
-                rule_commands = rule.execute(state)
-                commands.extend(rule_commands)
+                for command in rule.execute(state):
+                    commands.setdefault(command.get('actuator'), []).append(command)
                 triggered_rules.append(rule.name)
                 self.logger.info(f"Rule triggered: {rule.name}")
                 
@@ -124,5 +194,3 @@ class RuleEngine:
             self.logger.debug(f"Triggered rules: {', '.join(triggered_rules)}")
             
         return commands
-
-
@@ -1,16 +1,43 @@
 import threading
 import time
 import logging
-from queue import Queue
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from datetime import datetime
 
 from devices import (
     TemperatureSensor, LightSensor, MotionSensor,
-    LightActuator, HeaterActuator, AlarmActuator
+    LightActuator, HeaterActuator, AlarmActuator,
+    MPSCQueue
 )
 from .rule_engine import RuleEngine
 
+# config key -> (class, device id, display name, constructor defaults)
+_SENSOR_SPECS = {
+    'temperature': (TemperatureSensor, 'temp_01', 'Temperature Sensor', {
+        'update_interval': 2.0, 'initial_value': 20.0, 'min_value': 15.0,
+        'max_value': 25.0, 'variation_range': 2.0
+    }),
+    'light': (LightSensor, 'light_01', 'Light Sensor', {
+        'update_interval': 1.5, 'initial_value': 50.0, 'min_value': 0.0,
+        'max_value': 100.0, 'variation_range': 10.0
+    }),
+    'motion': (MotionSensor, 'motion_01', 'Motion Sensor', {
+        'update_interval': 3.0, 'motion_probability': 0.3
+    }),
+}
+
+_ACTUATOR_SPECS = {
+    'light': (LightActuator, 'light_act_01', 'Light Actuator', {
+        'initial_state': False
+    }),
+    'heater': (HeaterActuator, 'heater_01', 'Heater Actuator', {
+        'initial_state': False, 'target_temperature': 20.0
+    }),
+    'alarm': (AlarmActuator, 'alarm_01', 'Alarm Actuator', {
+        'initial_state': False
+    }),
+}
+
 
 class SmartHub:
     
@@ -18,14 +45,20 @@ class SmartHub:
         self.config = config
         self.logger = logging.getLogger(__name__)
         
-        self.sensor_data_queue = Queue()
-        self.actuator_command_queues: Dict[str, Queue] = {}
+        self._wake_event = threading.Event()
+        self.actuator_command_queues: Dict[str, MPSCQueue] = {}
         
         self.sensors: Dict[str, Any] = {}
         self.actuators: Dict[str, Any] = {}
+        self._sensor_schedule: List[List[Any]] = []
         
         self.state: Dict[str, Any] = {}
-        self._state_lock = threading.Lock()
+        self._sensor_readings: Dict[str, Dict[str, Any]] = {}
+        # Readings are stamped with time.monotonic_ns(); published state uses
+        # epoch seconds, so keep the offset between the two clocks.
+        self._epoch_offset = time.time() - time.monotonic()
+        self._actuator_views: Dict[str, Dict[str, Any]] = {}
+        self._actuator_snapshot: Optional[Dict[str, Dict[str, Any]]] = None
         
         self._running = False
         self._controller_thread: Optional[threading.Thread] = None
@@ -38,88 +71,46 @@ class SmartHub:
         sensors_config = self.config.get('sensors', {})
         actuators_config = self.config.get('actuators', {})
         
-        # Initialize sensors
-        if sensors_config.get('temperature', {}).get('enabled', False):
-            temp_config = sensors_config['temperature']
-            temp_sensor = TemperatureSensor(
-                device_id='temp_01',
-                name='Temperature Sensor',
-                update_interval=temp_config.get('update_interval', 2.0),
-                initial_value=temp_config.get('initial_value', 20.0),
-                min_value=temp_config.get('min_value', 15.0),
-                max_value=temp_config.get('max_value', 25.0),
-                variation_range=temp_config.get('variation_range', 2.0),
-                enabled=True,
-                data_queue=self.sensor_data_queue
-            )
-            self.sensors['temperature'] = temp_sensor
-            
-        if sensors_config.get('light', {}).get('enabled', False):
-            light_config = sensors_config['light']
-            light_sensor = LightSensor(
-                device_id='light_01',
-                name='Light Sensor',
-                update_interval=light_config.get('update_interval', 1.5),
-                initial_value=light_config.get('initial_value', 50.0),
-                min_value=light_config.get('min_value', 0.0),
-                max_value=light_config.get('max_value', 100.0),
-                variation_range=light_config.get('variation_range', 10.0),
+        for key, (cls, device_id, name, defaults) in _SENSOR_SPECS.items():
+            sensor_config = sensors_config.get(key, {})
+            if not sensor_config.get('enabled', False):
+                continue
+            params = {k: sensor_config.get(k, default) for k, default in defaults.items()}
+            self.sensors[key] = cls(
+                device_id=device_id,
+                name=name,
                 enabled=True,
-                data_queue=self.sensor_data_queue
+                threaded=False,
+                **params
             )
-            self.sensors['light'] = light_sensor
             
-        if sensors_config.get('motion', {}).get('enabled', False):
-            motion_config = sensors_config['motion']
-            motion_sensor = MotionSensor(
-                device_id='motion_01',
-                name='Motion Sensor',
-                update_interval=motion_config.get('update_interval', 3.0),
-                motion_probability=motion_config.get('motion_probability', 0.3),
+        for key, (cls, device_id, name, defaults) in _ACTUATOR_SPECS.items():
+            actuator_config = actuators_config.get(key, {})
+            if not actuator_config.get('enabled', False):
+                continue
+            params = {k: actuator_config.get(k, default) for k, default in defaults.items()}
+            # Shares the controller's wake event, so a put wakes the loop.
+            command_queue = MPSCQueue(self._wake_event)
+            self.actuator_command_queues[key] = command_queue
+            self.actuators[key] = cls(
+                device_id=device_id,
+                name=name,
                 enabled=True,
-                data_queue=self.sensor_data_queue
+                command_queue=command_queue,
+                **params
             )
-            self.sensors['motion'] = motion_sensor
-            
-        # Initialize actuators
-        if actuators_config.get('light', {}).get('enabled', False):
-            light_queue = Queue()
-            self.actuator_command_queues['light'] = light_queue
-            light_actuator = LightActuator(
-                device_id='light_act_01',
-                name='Light Actuator',
-                enabled=True,
-                initial_state=actuators_config['light'].get('initial_state', False),
-                command_queue=light_queue
-            )
-            self.actuators['light'] = light_actuator
-            
-        if actuators_config.get('heater', {}).get('enabled', False):
-            heater_queue = Queue()
-            self.actuator_command_queues['heater'] = heater_queue
-            heater_config = actuators_config['heater']
-            heater_actuator = HeaterActuator(
-                device_id='heater_01',
-                name='Heater Actuator',
-                enabled=True,
-                initial_state=heater_config.get('initial_state', False),
-                target_temperature=heater_config.get('target_temperature', 20.0),
-                command_queue=heater_queue
-            )
-            self.actuators['heater'] = heater_actuator
-            
-        if actuators_config.get('alarm', {}).get('enabled', False):
-            alarm_queue = Queue()
-            self.actuator_command_queues['alarm'] = alarm_queue
-            alarm_actuator = AlarmActuator(
-                device_id='alarm_01',
-                name='Alarm Actuator',
-                enabled=True,
-                initial_state=actuators_config['alarm'].get('initial_state', False),
-                command_queue=alarm_queue
-            )
-            self.actuators['alarm'] = alarm_actuator
             
+        # device_id and name never change; only 'state' is refreshed per tick.
+        self._actuator_views = {
+            key: {'state': actuator.get_state(), 'device_id': actuator.device_id, 'name': actuator.name}
+            for key, actuator in self.actuators.items()
+        }
+        
+        # Bound once so the simulation step needs no lookups or type checks.
+        self._temp_sensor = self.sensors.get('temperature')
+        self._light_sensor = self.sensors.get('light')
+        self._heater_act = self.actuators.get('heater')
+        self._light_act = self.actuators.get('light')
         self.logger.info(f"Initialized {len(self.sensors)} sensors and {len(self.actuators)} actuators")
         
     def start(self):
@@ -144,6 +135,7 @@ class SmartHub:
     def stop(self):
         self.logger.info("Stopping Smart Home Hub...")
         self._running = False
+        self._wake_event.set()
         
         for sensor in self.sensors.values():
             sensor.stop()
@@ -157,96 +149,112 @@ class SmartHub:
         self.logger.info("Smart Home Hub stopped")
         
     def _controller_loop(self):
+        next_simulation = time.monotonic()
+        # [due time, sensor type, sensor]; sensors are sampled here instead
+        # of on their own threads.
+        self._sensor_schedule = [
+            [next_simulation, key, sensor] for key, sensor in self.sensors.items()
+        ]
         while self._running:
             try:
-                self._process_sensor_data()
-                self._update_state()
-                self._evaluate_and_execute_rules()
-                self._simulate_device_interactions()
-                time.sleep(0.5)
+                now = time.monotonic()
+                next_sample = self._poll_sensors(now)
+                self._process_actuator_commands()
+                self._tick()
+                if now >= next_simulation:
+                    self._simulate_device_interactions()
+                    next_simulation = now + 0.5
+                deadline = min(next_simulation, next_sample)
+                self._wake_event.wait(max(0.0, deadline - time.monotonic()))
                 
             except Exception as e:
                 self.logger.error(f"Error in controller loop: {e}", exc_info=True)
-                time.sleep(1.0)
-                
-    def _process_sensor_data(self):
-        while not self.sensor_data_queue.empty():
-            try:
-                data = self.sensor_data_queue.get_nowait()
-                sensor_id = data.get('sensor_id', '')
-                sensor_name = data.get('sensor_name', '')
-                value = data.get('value')
-                timestamp = data.get('timestamp', time.time())
-                
-                sensor_type = None
-                for key, sensor in self.sensors.items():
-                    if sensor.device_id == sensor_id:
-                        sensor_type = key
-                        break
-                        
-                if sensor_type:
-                    with self._state_lock:
-                        if 'sensors' not in self.state:
-                            self.state['sensors'] = {}
-                        self.state['sensors'][sensor_type] = {
-                            'value': value,
-                            'timestamp': timestamp,
-                            'sensor_id': sensor_id,
-                            'sensor_name': sensor_name
-                        }
-                        
-            except Exception as e:
-                self.logger.error(f"Error processing sensor data: {e}")
-                
-    def _update_state(self):
-        with self._state_lock:
-            for sensor_type, sensor in self.sensors.items():
-                if 'sensors' not in self.state:
-                    self.state['sensors'] = {}
-                if sensor_type not in self.state['sensors']:
-                    self.state['sensors'][sensor_type] = {}
-                self.state['sensors'][sensor_type]['value'] = sensor.get_current_value()
-                
-            self.state['actuators'] = {}
-            for actuator_type, actuator in self.actuators.items():
-                self.state['actuators'][actuator_type] = {
-                    'state': actuator.get_state(),
-                    'device_id': actuator.device_id,
-                    'name': actuator.name
-                }
-                
-            self.state['temperature'] = self.state.get('sensors', {}).get('temperature', {})
-            self.state['light'] = self.state.get('sensors', {}).get('light', {})
-            self.state['motion'] = self.state.get('sensors', {}).get('motion', {})
-            self.state['heater'] = self.state.get('actuators', {}).get('heater', {})
-            self.state['light_actuator'] = self.state.get('actuators', {}).get('light', {})
-            self.state['alarm'] = self.state.get('actuators', {}).get('alarm', {})
+                self._wake_event.wait(1.0)
+            self._wake_event.clear()
             
-    def _evaluate_and_execute_rules(self):
-        with self._state_lock:
-            state_copy = self.state.copy()
+    def _poll_sensors(self, now: float) -> float:
+        readings = self._sensor_readings
+        next_sample = now + 1.0
+        for entry in self._sensor_schedule:
+            due, sensor_type, sensor = entry
+            if now >= due:
+                try:
+                    event = sensor.sample()
+                    readings[sensor_type] = {
+                        'value': event.value,
+                        'timestamp': event.timestamp / 1e9 + self._epoch_offset,
+                        'sensor_id': event.sensor_id,
+                        'sensor_name': event.sensor_name
+                    }
+                except Exception as e:
+                    self.logger.error(f"Error reading {sensor.name}: {e}")
+                due += sensor.update_interval
+                if due <= now:
+                    due = now + sensor.update_interval
+                entry[0] = due
+            if due < next_sample:
+                next_sample = due
+        return next_sample
+        
+    def _process_actuator_commands(self):
+        for actuator in self.actuators.values():
+            actuator.process_commands()
+            
+    def _tick(self):
+        # Single pass: build the next state snapshot from the latest readings,
+        # run the rules against it and publish it.
+        readings = self._sensor_readings
+        sensors = {}
+        for sensor_type, sensor in self.sensors.items():
+            entry = dict(readings.get(sensor_type, {}))
+            entry['value'] = sensor.get_current_value()
+            sensors[sensor_type] = entry
             
-        commands = self.rule_engine.evaluate_rules(state_copy)
+        views = self._actuator_views
+        changed = self._actuator_snapshot is None
+        for actuator_type, actuator in self.actuators.items():
+            view = views[actuator_type]
+            actuator_state = actuator.get_state()
+            if view['state'] != actuator_state:
+                view['state'] = actuator_state
+                changed = True
+        # The views are mutated in place, so a copy is only published when an
+        # actuator actually changed; otherwise the last one is reused.
+        if changed:
+            self._actuator_snapshot = {key: dict(view) for key, view in views.items()}
+        actuators = self._actuator_snapshot
+            
+        state = {
+            'sensors': sensors,
+            'actuators': actuators,
+            'temperature': sensors.get('temperature', {}),
+            'light': sensors.get('light', {}),
+            'motion': sensors.get('motion', {}),
+            'heater': actuators.get('heater', {}),
+            'light_actuator': actuators.get('light', {}),
+            'alarm': actuators.get('alarm', {})
+        }
         
-        for command in commands:
-            actuator_name = command.get('actuator')
-            if actuator_name in self.actuator_command_queues:
-                self.actuator_command_queues[actuator_name].put(command)
+        commands = self.rule_engine.evaluate_rules(state)
+        
+        # Published snapshots are never mutated afterwards, so readers can
+        # use self.state without a lock or a copy.
+        self.state = state
+        
+        for actuator_name, actuator_commands in commands.items():
+            actuator = self.actuators.get(actuator_name)
+            if actuator is not None:
+                actuator.execute_batch(actuator_commands)
                 
     def _simulate_device_interactions(self):
-        if 'heater' in self.actuators and 'temperature' in self.sensors:
-            heater_on = self.actuators['heater'].is_on()
-            if isinstance(self.sensors['temperature'], TemperatureSensor):
-                self.sensors['temperature'].simulate_heating_effect(heater_on)
-                
-        if 'light' in self.actuators and 'light' in self.sensors:
-            light_on = self.actuators['light'].is_on()
-            if isinstance(self.sensors['light'], LightSensor):
-                self.sensors['light'].simulate_light_effect(light_on)
+        if self._heater_act and self._temp_sensor:
+            self._temp_sensor.simulate_heating_effect(self._heater_act.is_on())
+            
+        if self._light_act and self._light_sensor:
+            self._light_sensor.simulate_light_effect(self._light_act.is_on())
                 
     def get_state(self) -> Dict[str, Any]:
-        with self._state_lock:
-            return self.state.copy()
+        return self.state
             
     def get_status(self) -> Dict[str, Any]:
         state = self.get_state()
@@ -1,12 +1,13 @@
 import json
 import signal
 import sys
+import threading
 import time
 from pathlib import Path
 from typing import Dict, Any
 
 from hub import SmartHub
-from services import LoggerService
+from services import LoggerService, configure_once
 from web.app import SmartHomeWebApp
 
 
@@ -17,6 +18,7 @@ class SmartHomeApplication:
         self.hub: SmartHub = None
         self.logger_service: LoggerService = None
         self.web_app: SmartHomeWebApp = None
+        self._shutdown_event = threading.Event()
         
     def _load_config(self, config_path: str) -> Dict[str, Any]:
         try:
@@ -32,6 +34,7 @@ class SmartHomeApplication:
     def initialize(self):
         print("Initializing Smart Home Hub...")
         
+        configure_once(self.config)
         self.logger_service = LoggerService(self.config)
         self.logger_service.start()
         
@@ -46,7 +49,6 @@ class SmartHomeApplication:
         
         self.hub.start()
         
-        import threading
         web_thread = threading.Thread(
             target=self.web_app.run,
             daemon=True
@@ -68,6 +70,9 @@ class SmartHomeApplication:
     def stop(self):
         print("\nShutting down Smart Home Hub...")
         
+        if self.web_app:
+            self.web_app.stop()
+            
         if self.hub:
             self.hub.stop()
             
@@ -84,8 +89,7 @@ class SmartHomeApplication:
             self.initialize()
             self.start()
             
-            while True:
-                time.sleep(1)
+            self._shutdown_event.wait()
                 
         except KeyboardInterrupt:
             pass
@@ -93,8 +97,8 @@ class SmartHomeApplication:
             self.stop()
             
     def _signal_handler(self, signum, frame):
-        self.stop()
-        sys.exit(0)
+        # run() performs the shutdown once the wait returns.
+        self._shutdown_event.set()
 
 
 def main():
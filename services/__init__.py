@@ -2,7 +2,8 @@
 Services module for Smart Home system.
 """
 from .logger_service import LoggerService
+from .logging_config import configure_once
 
-__all__ = ['LoggerService']
+__all__ = ['LoggerService', 'configure_once']
 
 
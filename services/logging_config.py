@@ -0,0 +1,46 @@
+import logging
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener
+from queue import Queue
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+
+_configured = False
+_listener: Optional[QueueListener] = None
+
+
+def configure_once(config: Dict[str, Any], log_queue: Optional[Queue] = None) -> QueueListener:
+    global _configured, _listener
+    if _configured:
+        return _listener
+        
+    log_config = config.get('logging', {})
+    log_file = log_config.get('log_file', 'logs/smart_home.log')
+    log_level = getattr(logging, log_config.get('log_level', 'INFO'))
+    
+    log_path = Path(log_file)
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    
+    file_handler = logging.FileHandler(log_file, encoding='utf-8')
+    console_handler = logging.StreamHandler()
+    
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    file_handler.setFormatter(formatter)
+    console_handler.setFormatter(formatter)
+    
+    # File writes are batched; errors (and a flush on stop) write immediately.
+    file_buffer = MemoryHandler(1024, flushLevel=logging.ERROR, target=file_handler)
+    
+    # Calling threads only merge each record's message and enqueue it
+    # (QueueHandler.prepare); the listener thread applies the handler
+    # formatters and does the file/console I/O.
+    log_queue = log_queue or Queue()
+    _listener = QueueListener(log_queue, file_buffer, console_handler)
+    
+    # Installed directly rather than via basicConfig, which would give the
+    # QueueHandler a BASIC_FORMAT formatter and prefix every message twice.
+    root = logging.getLogger()
+    root.setLevel(log_level)
+    root.addHandler(QueueHandler(log_queue))
+    _configured = True
+    return _listener
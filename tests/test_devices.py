@@ -0,0 +1,79 @@
+import threading
+import time
+import unittest
+from queue import Empty
+
+from devices import MPSCQueue, SensorEvent, TemperatureSensor
+
+
+class MPSCQueueTest(unittest.TestCase):
+    
+    def test_put_get_is_fifo(self):
+        q = MPSCQueue()
+        q.put(1)
+        q.put(2)
+        
+        self.assertFalse(q.empty())
+        self.assertEqual(q.get(), 1)
+        self.assertEqual(q.get_nowait(), 2)
+        self.assertTrue(q.empty())
+        
+    def test_get_on_empty_queue_raises(self):
+        q = MPSCQueue()
+        
+        self.assertRaises(Empty, q.get_nowait)
+        started = time.monotonic()
+        self.assertRaises(Empty, q.get, timeout=0.05)
+        self.assertGreaterEqual(time.monotonic() - started, 0.05)
+        
+    def test_shared_event_queue_is_non_blocking_only(self):
+        wake = threading.Event()
+        q = MPSCQueue(wake)
+        q.put('item')
+        
+        self.assertTrue(wake.is_set())
+        self.assertRaises(RuntimeError, q.get)
+        self.assertEqual(q.get_nowait(), 'item')
+        self.assertTrue(wake.is_set())
+        
+    def test_get_blocks_until_put(self):
+        q = MPSCQueue()
+        threading.Timer(0.05, q.put, args=('item',)).start()
+        
+        self.assertEqual(q.get(timeout=2.0), 'item')
+
+
+class StandaloneSensorTest(unittest.TestCase):
+    
+    def test_threaded_sensor_publishes_batches(self):
+        sensor = TemperatureSensor('temp_test', 'Test Sensor', update_interval=0.01,
+                                   min_value=15.0, max_value=25.0)
+        sensor.start()
+        time.sleep(0.2)
+        sensor.stop()
+        
+        events = []
+        while not sensor.data_queue.empty():
+            events.extend(sensor.data_queue.get_nowait())
+            
+        self.assertTrue(events)
+        for event in events:
+            self.assertIsInstance(event, SensorEvent)
+            self.assertEqual(event.sensor_id, 'temp_test')
+            self.assertTrue(15.0 <= event.value <= 25.0)
+        self.assertEqual(events[-1].value, sensor.get_current_value())
+        
+    def test_unthreaded_sensor_is_sampled_by_its_owner(self):
+        sensor = TemperatureSensor('temp_test', 'Test Sensor', update_interval=1.0,
+                                   threaded=False)
+        sensor.start()
+        
+        self.assertIsNone(sensor.data_queue)
+        self.assertTrue(sensor.is_running())
+        event = sensor.sample()
+        self.assertEqual(event.value, sensor.get_current_value())
+        sensor.stop()
+
+
+if __name__ == '__main__':
+    unittest.main()
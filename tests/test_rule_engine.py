@@ -0,0 +1,48 @@
+import unittest
+
+from hub.rule_engine import RuleEngine
+
+
+def _state(motion=None, light_on=False):
+    motion_entry = {} if motion is None else {'value': motion}
+    return {
+        'temperature': {'value': 20.0},
+        'light': {'value': 50.0},
+        'motion': motion_entry,
+        'heater': {'state': False},
+        'light_actuator': {'state': light_on},
+        'alarm': {'state': False},
+    }
+
+
+class RuleEngineTest(unittest.TestCase):
+    
+    def test_input_less_spec_rule_fires(self):
+        engine = RuleEngine({'rules': {}})
+        engine.clear_rules()
+        engine.add_rule('always', 'Always', [True],
+                        lambda state: [{'actuator': 'alarm', 'action': 'activate'}])
+        
+        commands = engine.evaluate_rules(_state())
+        
+        self.assertEqual(commands, {'alarm': [{'actuator': 'alarm', 'action': 'activate'}]})
+        
+    def test_missing_motion_reads_as_no_motion(self):
+        engine = RuleEngine({'rules': {}})
+        
+        commands = engine.evaluate_rules(_state(motion=None, light_on=True))
+        
+        self.assertEqual(commands, {'light': [{'actuator': 'light', 'action': 'turn_off'}]})
+        
+    def test_unchanged_inputs_are_not_re_evaluated(self):
+        engine = RuleEngine({'rules': {}})
+        state = _state(motion=False, light_on=True)
+        
+        self.assertIn('light', engine.evaluate_rules(state))
+        self.assertEqual(engine.evaluate_rules(state), {})
+        self.assertEqual(engine.evaluate_rules(_state(motion=False, light_on=False)), {})
+        self.assertIn('light', engine.evaluate_rules(state))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,8 +1,52 @@
-from flask import Flask, render_template, jsonify, request
+from flask import Flask, Response, render_template, jsonify, request
+from flask.json.provider import DefaultJSONProvider
+from werkzeug.exceptions import HTTPException
 import json
 import logging
 import os
-from typing import Dict, Any, Optional
+import threading
+import time
+from typing import Callable, Dict, Any, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(obj: Any) -> bytes:
+    # Shared by the cached endpoints and jsonify(): compact, unsorted, with
+    # Flask's default hook for dates, decimals, UUIDs and dataclasses.
+    # orjson would encode datetimes and dataclasses itself, so pass them
+    # through to the hook to get the same output as the stdlib path.
+    if orjson is not None:
+        return orjson.dumps(obj, default=DefaultJSONProvider.default,
+                            option=orjson.OPT_NON_STR_KEYS |
+                            orjson.OPT_PASSTHROUGH_DATETIME |
+                            orjson.OPT_PASSTHROUGH_DATACLASS)
+    return json.dumps(obj, default=DefaultJSONProvider.default,
+                      separators=(',', ':')).encode('utf-8')
+
+
+class _OrjsonProvider(DefaultJSONProvider):
+    
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        # Only the plain jsonify() path is routed to orjson; callers asking
+        # for json.dumps-specific options get the stdlib encoder.
+        if orjson is None or kwargs:
+            return super().dumps(obj, **kwargs)
+        return _dumps(obj).decode('utf-8')
+        
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        if orjson is None or kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+        
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        # The default response() always passes indent/separators through to
+        # dumps(), so encode with _dumps here to match the cached endpoints.
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(_dumps(obj), mimetype=self.mimetype)
 
 
 class SmartHomeWebApp:
@@ -10,92 +54,262 @@ class SmartHomeWebApp:
     def __init__(self, hub, config: Dict[str, Any]):
         self.hub = hub
         self.config = config
+        self.logger = logging.getLogger(__name__)
+        self._config_json = _dumps(config)
+        self._cmd_queues = hub.actuator_command_queues
+        self._ok_bodies = {
+            name: _dumps({'success': True, 'message': f'Command sent to {name}'})
+            for name in self._cmd_queues
+        }
         template_dir = os.path.join(os.path.dirname(__file__), 'templates')
         self.app = Flask(__name__, template_folder=template_dir)
+        self.app.json = _OrjsonProvider(self.app)
+        self.app.json.sort_keys = False
+        
+        self._cache_ttl = 0.2
+        self._json_cache: Dict[str, Tuple[float, bytes]] = {}
+        self._cache_lock = threading.Lock()
+        # SSE holds one server thread per open stream, so it is only offered
+        # on the thread-per-connection dev server (run() enables it), and each
+        # stream ends after _stream_events messages; EventSource reconnects.
+        self._stream_enabled = False
+        self._stream_interval = 0.5
+        self._stream_events = 120
+        
+        # /api/status is served from bytes refreshed by one background thread
+        # (started in run()). It only polls the hub while the hub is running
+        # and someone read the status within the last _status_idle_after
+        # seconds; otherwise it sleeps until a reader or an invalidation wakes it.
+        self._status_bytes = _dumps(hub.get_status())
+        self._status_read_at = 0.0
+        self._status_idle_after = 5.0
+        self._refresh_idle = True
+        self._refresh_failing = False
+        self._refresh_event = threading.Event()
+        self._refresh_stop = threading.Event()
+        self._refresh_thread: Optional[threading.Thread] = None
         
+        # Silence per-request access logs entirely rather than filtering
+        # each record by level.
         log = logging.getLogger('werkzeug')
-        log.setLevel(logging.ERROR)
+        log.handlers.clear()
+        log.propagate = False
+        log.disabled = True
         
         self._setup_routes()
         
+        # The two polled endpoints are answered before Flask routing runs;
+        # the Flask routes stay for every other method and path.
+        self._flask_wsgi_app = self.app.wsgi_app
+        self.app.wsgi_app = self._fast_wsgi_app
+        
     def _setup_routes(self):
         
+        @self.app.errorhandler(Exception)
+        def handle_error(e):
+            # Routes let unexpected errors propagate; HTTP errors (404, 405...)
+            # keep their own responses.
+            if isinstance(e, HTTPException):
+                return e
+            return jsonify({'error': str(e)}), 500
+            
         @self.app.route('/')
         def index():
             return render_template('index.html')
             
         @self.app.route('/api/status')
         def get_status():
-            try:
-                status = self.hub.get_status()
-                return jsonify(status)
-            except Exception as e:
-                return jsonify({'error': str(e)}), 500
+            return Response(self._read_status(), mimetype='application/json')
+                
+        @self.app.route('/api/stream')
+        def stream_status():
+            if not self._stream_enabled:
+                return jsonify({'error': 'Streaming is not available with this server'}), 404
+                
+            def generate():
+                yield b'retry: 1000\n\n'
+                for _ in range(self._stream_events):
+                    yield b'data: ' + self._read_status() + b'\n\n'
+                    time.sleep(self._stream_interval)
+                    
+            return Response(generate(), mimetype='text/event-stream',
+                            headers={'Cache-Control': 'no-cache'})
                 
         @self.app.route('/api/state')
         def get_state():
-            try:
-                state = self.hub.get_state()
-                return jsonify(state)
-            except Exception as e:
-                return jsonify({'error': str(e)}), 500
+            body = self._get_cached('state', self.hub.get_state)
+            return Response(body, mimetype='application/json')
                 
         @self.app.route('/api/actuator/<actuator_name>', methods=['POST'])
         def control_actuator(actuator_name):
-            try:
-                data = request.get_json() or {}
-                action = data.get('action', 'toggle')
-                
-                if actuator_name not in self.hub.actuator_command_queues:
-                    return jsonify({'error': f'Actuator {actuator_name} not found'}), 404
-                    
-                command = {
-                    'actuator': actuator_name,
-                    'action': action
-                }
-                
-                self.hub.actuator_command_queues[actuator_name].put(command)
-                return jsonify({'success': True, 'message': f'Command sent to {actuator_name}'})
+            data = self._request_json()
+            if data is None:
+                return jsonify({'error': 'Invalid JSON body'}), 400
+            action = data.get('action', 'toggle')
+            
+            command_queue = self._cmd_queues.get(actuator_name)
+            if command_queue is None:
+                return jsonify({'error': f'Actuator {actuator_name} not found'}), 404
                 
-            except Exception as e:
-                return jsonify({'error': str(e)}), 500
+            command = {
+                'actuator': actuator_name,
+                'action': action
+            }
+            
+            # The hub's queues share its wake event, so a put wakes the controller.
+            command_queue.put(command)
+            self._invalidate_cache()
+            return Response(self._ok_bodies[actuator_name], mimetype='application/json')
                 
         @self.app.route('/api/config')
         def get_config():
-            return jsonify(self.config)
+            return Response(self._config_json, mimetype='application/json')
             
         @self.app.route('/api/system/control', methods=['POST'])
         def control_system():
+            data = self._request_json()
+            if data is None:
+                return jsonify({'error': 'Invalid JSON body'}), 400
+            action = data.get('action', 'toggle')
+            
+            if action not in ('start', 'stop'):
+                # Toggle
+                action = 'stop' if self.hub._running else 'start'
+            if action == 'stop':
+                self.hub.stop()
+            else:
+                self.hub.start()
+            # Invalidate only once the transition is complete, so the
+            # refresher cannot cache a half-stopped or half-started hub.
+            self._invalidate_cache()
+            
+            if action == 'stop':
+                return jsonify({'success': True, 'message': 'System stopped', 'running': False})
+            return jsonify({'success': True, 'message': 'System started', 'running': True})
+            
+    def _request_json(self) -> Optional[Dict[str, Any]]:
+        # An empty body means "use the defaults"; a body that does not parse
+        # returns None so the route can reject it without side effects.
+        data = request.get_json(silent=True)
+        if data is None:
+            return None if request.get_data() else {}
+        return data
+        
+    def _get_cached(self, key: str, producer: Callable[[], Any]) -> bytes:
+        # Concurrent pollers within the TTL share one hub call and one encode.
+        cached_at, body = self._json_cache.get(key, (0.0, None))
+        if body is not None and time.monotonic() - cached_at < self._cache_ttl:
+            return body
+            
+        with self._cache_lock:
+            cached_at, body = self._json_cache.get(key, (0.0, None))
+            if body is None or time.monotonic() - cached_at >= self._cache_ttl:
+                body = _dumps(producer())
+                self._json_cache[key] = (time.monotonic(), body)
+            return body
+            
+    def _fast_wsgi_app(self, environ: Dict[str, Any], start_response: Callable) -> Any:
+        if environ.get('REQUEST_METHOD') == 'GET':
+            path = environ.get('PATH_INFO')
+            body = None
             try:
-                data = request.get_json() or {}
-                action = data.get('action', 'toggle')
-                
-                if action == 'stop':
-                    self.hub.stop()
-                    return jsonify({'success': True, 'message': 'System stopped', 'running': False})
-                elif action == 'start':
-                    self.hub.start()
-                    return jsonify({'success': True, 'message': 'System started', 'running': True})
-                else:
-                    # Toggle
-                    if self.hub._running:
-                        self.hub.stop()
-                        return jsonify({'success': True, 'message': 'System stopped', 'running': False})
-                    else:
-                        self.hub.start()
-                        return jsonify({'success': True, 'message': 'System started', 'running': True})
-                        
-            except Exception as e:
-                return jsonify({'error': str(e)}), 500
+                if path == '/api/status':
+                    body = self._read_status()
+                elif path == '/api/state':
+                    body = self._get_cached('state', self.hub.get_state)
+            except Exception:
+                body = None
+            if body is not None:
+                start_response('200 OK', [
+                    ('Content-Type', 'application/json'),
+                    ('Content-Length', str(len(body)))
+                ])
+                return [body]
+        return self._flask_wsgi_app(environ, start_response)
+        
+    def _invalidate_cache(self):
+        self._json_cache.clear()
+        self._refresh_event.set()
+        
+    def _read_status(self) -> bytes:
+        self._status_read_at = time.monotonic()
+        if self._refresh_idle:
+            # The refresher is not polling, so the cached bytes may be old:
+            # rebuild them here, and wake it to resume polling a running hub.
+            self._refresh_status()
+            if self.hub._running:
+                self._refresh_event.set()
+        return self._status_bytes
+        
+    def _refresh_status(self):
+        try:
+            self._status_bytes = _dumps(self.hub.get_status())
+        except Exception as e:
+            # Log the first failure of a run, not every 200 ms retry.
+            if not self._refresh_failing:
+                self.logger.error("Error refreshing status: %s", e)
+            self._refresh_failing = True
+        else:
+            self._refresh_failing = False
+            
+    def _refresh_loop(self):
+        while not self._refresh_stop.is_set():
+            reading = time.monotonic() - self._status_read_at < self._status_idle_after
+            polling = reading and self.hub._running
+            # While not polling, readers rebuild the bytes themselves.
+            self._refresh_idle = not polling
+            self._refresh_event.wait(self._cache_ttl if polling else None)
+            self._refresh_event.clear()
+            if self._refresh_stop.is_set():
+                break
+            self._refresh_status()
+        self._refresh_idle = True
+        
+    def stop(self):
+        self._refresh_stop.set()
+        self._refresh_event.set()
+        if self._refresh_thread:
+            self._refresh_thread.join(timeout=2.0)
+            self._refresh_thread = None
             
     def run(self):
+        if self._refresh_thread is None:
+            self._refresh_stop.clear()
+            self._refresh_thread = threading.Thread(target=self._refresh_loop, daemon=True)
+            self._refresh_thread.start()
+            
         flask_config = self.config.get('flask', {})
         host = flask_config.get('host', '127.0.0.1')
         port = flask_config.get('port', 5000)
         debug = flask_config.get('debug', False)
+        server = flask_config.get('server', 'dev')
         
+        # Optional production servers; fall back to the dev server if the
+        # chosen one is not installed.
+        if server == 'bjoern':
+            try:
+                import bjoern
+            except ImportError:
+                logging.getLogger(__name__).warning("bjoern not installed, using the Flask dev server")
+            else:
+                bjoern.run(self.app, host, port)
+                return
+        elif server == 'waitress':
+            try:
+                import waitress
+            except ImportError:
+                logging.getLogger(__name__).warning("waitress not installed, using the Flask dev server")
+            else:
+                waitress.serve(self.app, host=host, port=port, threads=8)
+                return
+        elif server != 'dev':
+            logging.getLogger(__name__).warning(
+                f"Unknown flask.server {server!r} (expected 'dev', 'waitress' or 'bjoern'), "
+                "using the Flask dev server")
+                
         import warnings
         warnings.filterwarnings('ignore', category=UserWarning)
         
+        self._stream_enabled = True
         self.app.run(host=host, port=port, debug=debug, threaded=True, use_reloader=False)
 